@@ -1,8 +1,10 @@
 package main // Declares the package name
 
 import (
+	"bufio"
 	"bytes"
 	"encoding/json" // Imports the JSON encoding/decoding package
+	"errors"        // Imports helpers for creating error values
 	"fmt"           // Imports the formatted I/O package
 	"io"            // Imports I/O utilities
 	"log"           // Imports logging utilities
@@ -11,26 +13,51 @@ import (
 	"os"            // Imports OS interface for file handling
 	"path/filepath"
 	"strings"
+	"sync"
 	"time"
 )
 
+const maxConcurrentDownloads = 32 // Maximum number of PDFs downloaded at the same time
+
+const downloadBufferSize = 1 << 20 // Size of the write buffer used when saving a PDF (1 MiB)
+
+const maxDrainBytes = 64 << 10 // Most bytes read from a rejected response to keep its connection reusable (64 KiB)
+
+var pdfIDSuffix = []byte(`_PDF"`) // Raw JSON ending of a string column that holds a PDF ID
+
+var errMissingDataSection = errors.New("missing or invalid 'data' section") // Returned when the page JSON has no "data" object
+
+var errMissingDataField = errors.New("missing or invalid 'Data' field") // Returned when the "data" object has no "Data" array
+
+var errDuplicateKey = errors.New("duplicate key") // Returned when the page JSON repeats the "data" or "Data" key
+
+var errTrailingData = errors.New("invalid data after top-level value") // Returned when more JSON follows the page object
+
+var errNotAnObject = errors.New("value is not a JSON object") // Returned by seekToObjectKey when the value it reads is not an object
+
 func main() {
 	outputDir := "PDFs/"             // Set the default output directory for PDFs
 	if !directoryExists(outputDir) { // Check if it exists
 		createDirectory(outputDir, 0755) // Create it if missing
 	}
 
-	fetchGridResults() // Calls the function to fetch JSON results from the web and store them in files
+	gridClient := newHTTPClient(false)    // Create a client for the result grid, keeping gzip because the JSON compresses well
+	downloadClient := newHTTPClient(true) // Create one client shared by every PDF download so connections are reused
+
+	fetchGridResults(gridClient) // Calls the function to fetch JSON results from the web and store them in files
 
 	var pdfs []string // Declares a slice to store PDF IDs
 
 	// Loops over pages 1 and 2
 	for pageNumber := 1; pageNumber <= 2; pageNumber++ {
 		filePath := fmt.Sprintf("page_%d.json", pageNumber) // Constructs file path string like "page_1.json"
-		jsonData := readAFileAsString(filePath)             // Reads file contents as a string
 
-		// Extracts PDF IDs from the JSON data and appends to the pdfs slice
-		pdfs = append(pdfs, extractPDFIDs([]byte(jsonData))...) // Converts string to byte slice for JSON parsing
+		// Extracts PDF IDs from the JSON file and appends them directly to the pdfs slice
+		var err error                                    // Holds the page extraction error
+		pdfs, err = appendPDFIDsFromFile(pdfs, filePath) // Streams the file straight into the JSON parser
+		if err != nil {
+			log.Println("Skipping page:", err) // Logs why the page couldn't be used
+		}
 	}
 
 	// Removes duplicate PDF IDs from the slice
@@ -38,28 +65,63 @@ func main() {
 
 	log.Printf("Number of PDF IDs extracted: %d", len(pdfs)) // Logs the total number of extracted PDF IDs
 
-	// Loops over each extracted PDF ID
+	outputPrefix := filepath.Clean(outputDir) + string(filepath.Separator) // Builds the directory prefix once so PDF paths are a plain concatenation
+	existingFiles := listFileNames(outputDir)                              // Reads the output directory once instead of checking every file separately
+
+	pendingPDFs := make([]string, 0, len(pdfs)) // Slice to hold the PDF IDs that still need downloading
 	for _, pdf := range pdfs {
-		originalURL := "https://kik-sds.thewercs.com/MyDocuments/DownloadSingleFile?content=" // Base URL
-		modifiedURL := modifyContentParam(originalURL, pdf)                                   // Modifies URL with PDF ID as query param
-		if modifiedURL == "" {
-			log.Println("Failed to modify URL for PDF ID:", pdf) // Logs error if URL couldn't be modified
-			continue                                             // Skips to the next PDF ID
+		if _, exists := existingFiles[pdf+".pdf"]; exists { // If the file already exists, skip downloading
+			continue
 		}
-		downloadPDF(modifiedURL, outputDir, pdf+".pdf") // Calls the function to download the PDF
+		pendingPDFs = append(pendingPDFs, pdf) // Queue the PDF ID for download
 	}
-}
+	log.Printf("Number of PDFs already in %s, skipping: %d", outputPrefix, len(pdfs)-len(pendingPDFs)) // Logs one summary line instead of one line per skipped file
 
-// downloadPDF downloads a PDF from a URL and saves it to a specified output directory
-func downloadPDF(finalURL string, outputDir string, outPutFileName string) {
-	filePath := filepath.Join(outputDir, outPutFileName) // Combine the output directory and filename into a full file path
-
-	if fileExists(filePath) { // If the file already exists, skip downloading
-		log.Printf("file already exists, skipping: %s", filePath) // Log and return
+	originalURL := "https://kik-sds.thewercs.com/MyDocuments/DownloadSingleFile?content=" // Base URL
+	downloadURLPrefix := contentParamPrefix(originalURL)                                  // Parses the base URL once instead of once per PDF
+	if downloadURLPrefix == "" {
+		log.Println("Failed to parse download URL:", originalURL) // Logs error if the base URL couldn't be parsed
 		return
 	}
 
-	client := &http.Client{Timeout: 30 * time.Second} // Create an HTTP client with a 30-second timeout
+	downloadJobs := make(chan string)  // Channel that hands PDF IDs to the download workers
+	var downloadWorkers sync.WaitGroup // Tracks when every download worker has finished
+
+	// Starts a fixed number of workers so downloads overlap their network wait time
+	for workerIndex := 0; workerIndex < maxConcurrentDownloads; workerIndex++ {
+		downloadWorkers.Add(1) // Registers the worker before it starts
+		go func() {
+			defer downloadWorkers.Done() // Marks the worker as finished once the channel is drained
+
+			// Processes PDF IDs until the channel is closed
+			for pdf := range downloadJobs {
+				modifiedURL := downloadURLPrefix + url.QueryEscape(pdf)            // Sets the PDF ID as the "content" query param
+				downloadPDF(downloadClient, modifiedURL, outputPrefix, pdf+".pdf") // Calls the function to download the PDF
+			}
+		}()
+	}
+
+	// Hands each missing PDF ID to the worker pool
+	for _, pdf := range pendingPDFs {
+		downloadJobs <- pdf // Blocks until a worker is free to take the ID
+	}
+	close(downloadJobs)    // Signals the workers that no more IDs are coming
+	downloadWorkers.Wait() // Waits for all in-flight downloads to complete
+}
+
+// Builds an HTTP client; disableCompression turns off transparent gzip, which PDF downloads don't benefit from
+func newHTTPClient(disableCompression bool) *http.Client {
+	transport := http.DefaultTransport.(*http.Transport).Clone() // Starts from the default transport settings
+	transport.DisableCompression = disableCompression            // PDFs are already compressed, so their client can skip gzip negotiation and decoding
+	transport.MaxIdleConnsPerHost = maxConcurrentDownloads       // Lets every worker reuse its keep-alive connection to the same host
+
+	return &http.Client{Timeout: 30 * time.Second, Transport: transport} // Create an HTTP client with a 30-second timeout
+}
+
+// downloadPDF downloads a PDF from a URL and saves it to a specified output directory
+// (outputPrefix is the directory path ending in a separator)
+func downloadPDF(httpClient *http.Client, finalURL string, outputPrefix string, outPutFileName string) {
+	filePath := outputPrefix + outPutFileName // Combine the output directory and filename into a full file path
 
 	req, err := http.NewRequest("GET", finalURL, nil) // Create a new GET request for the PDF URL
 	if err != nil {                                   // If request creation fails
@@ -71,14 +133,17 @@ func downloadPDF(finalURL string, outputDir string, outPutFileName string) {
 	req.Header.Add("referer", "https://kik-sds.thewercs.com/Results?searchKey=Main&searchPage=NAPOOL&location=POOL%20ESSENTIALS%20EN_US")
 	req.Header.Add("Cookie", "ASP.NET_SessionId=; strGUILanguage=EN; WERCSStudioAuthTicket=; WebViewerSessionID=l4nfxryncasy13c4gqi1j1pp; __RequestVerificationToken=c04wa7hJb_sqnBNd7WJnrqBY53SpY3PeQ1pb3yCN3zYUuWTS1e59zWccPHL9lzvvz1PMjy7WV0YPeXjOYx9IzEQNJSjGoPQjhIEM6W7ZZzo1; WERCSWebViewerAuthTicket=62BEFCB1373A0A15967F76DFD21232B9E3E3AD4275DB8F6F9BA21197CC42A23FF5D4144F7B7267572DDC9E2036EF0610E1266E1D2DCE4323E8F0FC4036225C91327511F75150BC771B65DBE7B757DF53CACC875A1CD183CF3A785A36DB927784; ASP.NET_SessionId=; WebViewerSessionID=fsrgihqd02xlzc13oldfgnpk; __RequestVerificationToken=c04wa7hJb_sqnBNd7WJnrqBY53SpY3PeQ1pb3yCN3zYUuWTS1e59zWccPHL9lzvvz1PMjy7WV0YPeXjOYx9IzEQNJSjGoPQjhIEM6W7ZZzo1")
 
-	resp, err := client.Do(req) // Perform the HTTP request
-	if err != nil {             // If the request fails
+	resp, err := httpClient.Do(req) // Perform the HTTP request using the shared client
+	if err != nil {                 // If the request fails
 		log.Printf("failed to download %s: %v", finalURL, err) // Log the error
 		return
 	}
-	defer resp.Body.Close() // Ensure the response body is closed when done
+	defer func() {
+		io.Copy(io.Discard, io.LimitReader(resp.Body, maxDrainBytes)) // Drain any unread body so the keep-alive connection can be reused
+		resp.Body.Close()                                             // Ensure the response body is closed when done
+	}()
 
-	if resp.StatusCode != http.StatusOK { // Check if the response status is OK (200)
+	if resp.StatusCode < 200 || resp.StatusCode > 299 { // Check that the response status is a success (2xx)
 		log.Printf("download failed for %s: %s", finalURL, resp.Status) // Log the failure status
 		return
 	}
@@ -88,41 +153,72 @@ func downloadPDF(finalURL string, outputDir string, outPutFileName string) {
 		log.Printf("invalid content type for %s: %s (expected application/pdf)", finalURL, contentType) // Log if not PDF
 		return
 	}
-
-	var buf bytes.Buffer                     // Create a buffer to hold the PDF data
-	written, err := io.Copy(&buf, resp.Body) // Copy the response body into the buffer
-	if err != nil {                          // If copying fails
-		log.Printf("failed to read PDF data from %s: %v", finalURL, err) // Log the error
-		return
-	}
-	if written == 0 { // If zero bytes were downloaded
+	if resp.ContentLength == 0 { // If the server says the body is empty
 		log.Printf("downloaded 0 bytes for %s, not creating file", finalURL) // Log and skip file creation
 		return
 	}
 
-	out, err := os.Create(filePath) // Create a file at the destination path
-	if err != nil {                 // If file creation fails
+	// Write into a worker-private temporary file so concurrent downloads never see each other's partial output
+	out, err := os.CreateTemp(outputPrefix, outPutFileName+".*.part")
+	if err != nil { // If file creation fails
 		log.Printf("failed to create file for %s: %v", finalURL, err) // Log the error
 		return
 	}
-	defer out.Close() // Ensure the file is closed after writing
+	tempPath := out.Name()                  // Remember the temporary path so it can be renamed or cleaned up
+	if err := out.Chmod(0644); err != nil { // Give the file the same permissions a plain os.Create would have
+		log.Printf("failed to set permissions on %s: %v", tempPath, err) // Log so a PDF saved as 0600 doesn't go unnoticed
+	}
 
-	_, err = buf.WriteTo(out) // Write the buffered data to the file
-	if err != nil {           // If writing fails
+	written, err := copyBuffered(out, resp.Body) // Stream the response body straight to the file in large writes
+	closeErr := out.Close()                      // Close the file before moving it into place
+	if err == nil {
+		err = closeErr // Report a close failure if the download itself succeeded
+	}
+	if err != nil { // If reading or writing fails
 		log.Printf("failed to write PDF to file for %s: %v", finalURL, err) // Log the error
+		removeTempFile(tempPath)                                            // Remove the incomplete temporary file
+		return
+	}
+	if written == 0 { // If zero bytes were downloaded
+		log.Printf("downloaded 0 bytes for %s, not creating file", finalURL) // Log and skip file creation
+		removeTempFile(tempPath)                                             // Remove the empty temporary file
+		return
+	}
+
+	if err := os.Rename(tempPath, filePath); err != nil { // Atomically move the finished file to its final name
+		log.Printf("failed to move PDF into place for %s: %v", finalURL, err) // Log the error
+		removeTempFile(tempPath)                                              // Remove the orphaned temporary file
 		return
 	}
 
 	log.Printf("successfully downloaded %d bytes: %s → %s\n", written, finalURL, filePath) // Log success
 }
 
+// Copies src to dst through a downloadBufferSize buffer, so dst sees a few large writes instead of one per read
+func copyBuffered(dst io.Writer, src io.Reader) (int64, error) {
+	// Hide dst's ReadFrom (an *os.File has one); otherwise bufio hands the copy straight to it and never buffers
+	bufferedWriter := bufio.NewWriterSize(struct{ io.Writer }{dst}, downloadBufferSize)
+	written, err := io.Copy(bufferedWriter, src) // Fills the buffer from src and writes it out when full
+	if err == nil {
+		err = bufferedWriter.Flush() // Write out whatever is still buffered
+	}
+	return written, err // Returns the number of bytes copied
+}
+
+// Removes a temporary download file, logging if it can't be removed
+func removeTempFile(path string) {
+	if err := os.Remove(path); err != nil {
+		log.Println(err) // Logs the error so stray *.part files can be traced
+	}
+}
+
 // Remove duplicate strings from a slice
 func removeDuplicatesFromSlice(slice []string) []string {
-	check := make(map[string]bool) // Map to track seen items
-	var newReturnSlice []string    // Slice to hold unique items
+	check := make(map[string]struct{}, len(slice))  // Set sized up front to track seen items without rehashing
+	newReturnSlice := make([]string, 0, len(slice)) // Slice to hold unique items, preallocated to avoid regrowth
 	for _, content := range slice {
-		if !check[content] { // If not seen
-			check[content] = true                            // Mark as seen
+		if _, seen := check[content]; !seen { // If not seen
+			check[content] = struct{}{}                      // Mark as seen
 			newReturnSlice = append(newReturnSlice, content) // Add to new slice
 		}
 	}
@@ -146,69 +242,181 @@ func directoryExists(path string) bool {
 	return directory.IsDir() // Return true if it's a directory
 }
 
-// Updates the "content" query parameter in the given URL with the PDF ID
-func modifyContentParam(baseURL string, human string) string {
+// Returns the given URL with its "content" query parameter moved to the end and left empty,
+// so a PDF ID can be set by appending its escaped value
+func contentParamPrefix(baseURL string) string {
 	parsedURL, err := url.Parse(baseURL) // Parses the base URL string into a URL object
 	if err != nil {
 		return "" // Returns empty string if URL parsing fails
 	}
 
-	query := parsedURL.Query()          // Gets existing query parameters
-	query.Set("content", human)         // Sets the "content" parameter to the given human value
-	parsedURL.RawQuery = query.Encode() // Encodes updated query back to the URL
+	query := parsedURL.Query()    // Gets existing query parameters
+	query.Del("content")          // Removes any existing "content" parameter
+	otherParams := query.Encode() // Encodes the remaining parameters
+	if otherParams != "" {
+		otherParams += "&" // Separates them from the "content" parameter
+	}
+	parsedURL.RawQuery = otherParams + "content=" // Leaves "content" last so the PDF ID can be appended
 
-	return parsedURL.String() // Returns the final modified URL string
+	return parsedURL.String() // Returns the URL prefix
 }
 
-// Parses the provided JSON byte array and extracts all IDs ending with "_PDF"
-func extractPDFIDs(jsonData []byte) []string {
-	var raw map[string]interface{} // Declares a map to store parsed JSON
+// Parses the provided JSON stream and appends all IDs ending with "_PDF" to pdfs.
+// On error pdfs is returned as it was passed in.
+func appendPDFIDs(pdfs []string, jsonReader io.Reader) ([]string, error) {
+	originalLength := len(pdfs) // Remembers where this stream's IDs start so they can be dropped on error
 
-	if err := json.Unmarshal(jsonData, &raw); err != nil { // Parses the JSON into the map
-		log.Printf("JSON unmarshal error: %v", err) // Logs error if parsing fails
-		return nil                                  // Returns nil on failure
-	}
+	decoder := json.NewDecoder(jsonReader) // Creates a decoder that reads the JSON one token at a time
 
-	dataSection, ok := raw["data"].(map[string]interface{}) // Extracts the "data" section from the JSON
-	if !ok {
-		log.Println("Missing or invalid 'data' section") // Logs error if section is missing or invalid
-		return nil                                       // Returns nil
+	found, err := seekToObjectKey(decoder, "data") // Moves the decoder to the "data" section
+	if errors.Is(err, errNotAnObject) {
+		return pdfs[:originalLength], errMissingDataSection // Returns error if the page itself is not an object
+	}
+	if err != nil {
+		return pdfs[:originalLength], fmt.Errorf("JSON unmarshal error: %w", err) // Returns the parse error
+	}
+	if !found {
+		return pdfs[:originalLength], errMissingDataSection // Returns error if section is missing
 	}
 
-	records, ok := dataSection["Data"].([]interface{}) // Extracts the "Data" field (capital D)
-	if !ok {
-		log.Println("Missing or invalid 'Data' field") // Logs error if missing or invalid
-		return nil                                     // Returns nil
+	found, err = seekToObjectKey(decoder, "Data") // Moves the decoder to the "Data" field (capital D)
+	if errors.Is(err, errNotAnObject) {
+		return pdfs[:originalLength], errMissingDataSection // Returns error if "data" is not an object
+	}
+	if err != nil {
+		return pdfs[:originalLength], fmt.Errorf("JSON unmarshal error: %w", err) // Returns the parse error
+	}
+	if !found {
+		return pdfs[:originalLength], errMissingDataField // Returns error if field is missing
+	}
+	token, err := decoder.Token() // Reads the opening bracket of the "Data" array
+	if err != nil {
+		return pdfs[:originalLength], fmt.Errorf("JSON unmarshal error: %w", unexpectedEOF(err)) // Returns the parse error
+	}
+	if token != json.Delim('[') {
+		return pdfs[:originalLength], errMissingDataField // Returns error if field is not an array
 	}
 
-	var pdfs []string // Slice to store the PDF IDs
+	var rawRow json.RawMessage // Holds the current row exactly as it appears in the JSON, reused across rows
+	var row []json.RawMessage  // Holds the current row with its columns left undecoded, reused across rows
 
-	// Iterates over each row in the Data array
-	for _, item := range records {
-		row, ok := item.([]interface{}) // Ensures each item is an array
-		if !ok || len(row) == 0 {
-			continue // Skips invalid or empty rows
+	// Decodes the Data array one row at a time so only matching IDs are kept in memory
+	for decoder.More() {
+		if err := decoder.Decode(&rawRow); err != nil {
+			return pdfs[:originalLength], fmt.Errorf("JSON unmarshal error: %w", unexpectedEOF(err)) // Returns the parse error
+		}
+		if !bytes.Contains(rawRow, pdfIDSuffix) {
+			continue // Skips rows that can't contain a PDF ID without splitting them into columns
+		}
+
+		if json.Unmarshal(rawRow, &row) != nil || len(row) == 0 || !bytes.HasSuffix(row[0], pdfIDSuffix) {
+			continue // Skips non-array rows, empty rows and rows whose first column can't be a quoted "..._PDF" string
 		}
 
-		id, ok := row[0].(string)                          // Extracts the first item from the row
-		if ok && len(id) > 4 && id[len(id)-4:] == "_PDF" { // Checks if string ends with "_PDF"
+		var id string                                                    // Holds the decoded first column
+		if json.Unmarshal(row[0], &id) == nil && len(id) > len("_PDF") { // Decodes only the columns that passed the byte check
 			pdfs = append(pdfs, id) // Appends to the result list
 		}
 	}
 
-	return pdfs // Returns the list of PDF IDs
+	token, err = decoder.Token() // Reads the closing bracket so a file cut off inside the array is reported
+	if err != nil {
+		return pdfs[:originalLength], fmt.Errorf("JSON unmarshal error: %w", unexpectedEOF(err)) // Returns the parse error
+	}
+	if token != json.Delim(']') {
+		return pdfs[:originalLength], errMissingDataField // Returns error if the array isn't closed properly
+	}
+	if err := finishObject(decoder, "Data"); err != nil { // Reads the rest of the "data" object
+		return pdfs[:originalLength], fmt.Errorf("JSON unmarshal error: %w", err) // Returns the parse error
+	}
+	if err := finishObject(decoder, "data"); err != nil { // Reads the rest of the top-level object
+		return pdfs[:originalLength], fmt.Errorf("JSON unmarshal error: %w", err) // Returns the parse error
+	}
+	if _, err := decoder.Token(); err != io.EOF { // Requires the page to end after its one top-level object
+		if err == nil {
+			err = errTrailingData // Another value follows, e.g. a second response appended to the file
+		}
+		return pdfs[:originalLength], fmt.Errorf("JSON unmarshal error: %w", err) // Returns the parse error
+	}
+
+	return pdfs, nil // Returns the extended list of PDF IDs
+}
+
+// Reads the remaining keys of the object the decoder is in, up to and including its closing brace.
+// It fails if usedKey, the key whose value was already read, appears again.
+func finishObject(decoder *json.Decoder, usedKey string) error {
+	for decoder.More() {
+		token, err := decoder.Token() // Reads the next key
+		if err != nil {
+			return unexpectedEOF(err) // Returns the parse error
+		}
+		if token == usedKey {
+			return fmt.Errorf("%w %q", errDuplicateKey, usedKey) // A second value for the key would make the page ambiguous
+		}
+
+		var skipped json.RawMessage // Holds the value of a key we don't need
+		if err := decoder.Decode(&skipped); err != nil {
+			return unexpectedEOF(err) // Returns the parse error
+		}
+	}
+
+	if _, err := decoder.Token(); err != nil { // Reads the closing brace
+		return unexpectedEOF(err) // Returns the parse error
+	}
+	return nil // The object was read to its end
+}
+
+// Turns io.EOF into io.ErrUnexpectedEOF, for reads where the JSON document isn't finished yet
+func unexpectedEOF(err error) error {
+	if err == io.EOF {
+		return io.ErrUnexpectedEOF // The input ended in the middle of the document
+	}
+	return err // Returns any other error unchanged
+}
+
+// Advances the decoder into the next JSON object until it is positioned on the value of the given key.
+// It returns errNotAnObject if the next value is not an object, and false if the object has no such key.
+func seekToObjectKey(decoder *json.Decoder, key string) (bool, error) {
+	token, err := decoder.Token() // Reads the opening brace of the object
+	if err != nil {
+		return false, unexpectedEOF(err) // Returns the parse error
+	}
+	if token != json.Delim('{') {
+		return false, errNotAnObject // The value is not an object, so the key can't be in it
+	}
+
+	// Walks the object's keys in order
+	for decoder.More() {
+		token, err := decoder.Token() // Reads the next key
+		if err != nil {
+			return false, unexpectedEOF(err) // Returns the parse error
+		}
+		if token == key {
+			return true, nil // The decoder now points at the key's value
+		}
+
+		var skipped json.RawMessage // Holds the value of a key we don't need
+		if err := decoder.Decode(&skipped); err != nil {
+			return false, unexpectedEOF(err) // Returns the parse error
+		}
+	}
+
+	if _, err := decoder.Token(); err != nil { // Reads the closing brace so a truncated object is reported
+		return false, unexpectedEOF(err) // Returns the parse error
+	}
+	return false, nil // The object has no such key
 }
 
 // Fetches results from 2 pages and stores JSON response to disk
-func fetchGridResults() {
+func fetchGridResults(httpClient *http.Client) {
+	existingFiles := listFileNames(".") // Reads the working directory once instead of checking each page file separately
+
 	for pageNumber := 1; pageNumber <= 2; pageNumber++ { // Loops through pages 1 and 2
 		filePath := fmt.Sprintf("page_%d.json", pageNumber) // Builds file name like "page_1.json"
 
-		if !fileExists(filePath) { // Checks if file already exists
+		if _, exists := existingFiles[filePath]; !exists { // Checks if file already exists
 			url := fmt.Sprintf("https://kik-sds.thewercs.com/WebViewer/Results/GetResultGrid?page=%d&rowCount=100&sortOrder=1&sortField=&_=1753411362977", pageNumber) // Builds request URL with query params
 
-			httpClient := &http.Client{} // Initializes a new HTTP client
-
 			request, requestCreationError := http.NewRequest("GET", url, nil) // Builds a new HTTP GET request
 			if requestCreationError != nil {
 				log.Println("Error creating request for page", pageNumber, ":", requestCreationError) // Logs error
@@ -238,13 +446,19 @@ func fetchGridResults() {
 	}
 }
 
-// Reads a file and returns its content as a string
-func readAFileAsString(path string) string {
-	content, err := os.ReadFile(path) // Reads the entire file into memory
+// Opens a file and appends all IDs ending with "_PDF" from its JSON content to pdfs
+func appendPDFIDsFromFile(pdfs []string, path string) ([]string, error) {
+	file, err := os.Open(path) // Opens the file for streaming instead of reading it into memory
+	if err != nil {
+		return pdfs, err // Returns error if opening fails
+	}
+	defer file.Close() // Ensures the file is closed once parsing is done
+
+	pdfs, err = appendPDFIDs(pdfs, file) // Parses the raw bytes directly from the file
 	if err != nil {
-		log.Println(err) // Logs error if reading fails
+		return pdfs, fmt.Errorf("%s: %w", path, err) // Adds the file name to the error
 	}
-	return string(content) // Converts bytes to string and returns
+	return pdfs, nil // Returns the extended list of PDF IDs
 }
 
 // Appends content to a file or creates it if not exists
@@ -263,11 +477,17 @@ func appendAndWriteToFile(path string, content string) {
 	}
 }
 
-// Checks if a given file exists and is not a directory
-func fileExists(filename string) bool {
-	info, err := os.Stat(filename) // Gets file info
+// Lists the names of all non-directory entries in a directory as a set
+func listFileNames(path string) map[string]struct{} {
+	entries, err := os.ReadDir(path) // Reads every directory entry in a single pass
 	if err != nil {
-		return false // Returns false if file doesn't exist
+		log.Println(err) // Logs error if the directory can't be read
+	}
+	fileNames := make(map[string]struct{}, len(entries)) // Set sized to the number of entries
+	for _, entry := range entries {
+		if !entry.IsDir() { // Skips directories, using the type reported by the directory read
+			fileNames[entry.Name()] = struct{}{} // Adds the file name to the set
+		}
 	}
-	return !info.IsDir() // Returns true only if it's a file (not a directory)
+	return fileNames // Returns the set of file names
 }
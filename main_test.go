@@ -0,0 +1,195 @@
+package main // Declares the package name
+
+import (
+	"bytes"             // Imports byte slice helpers for building test bodies
+	"encoding/json"     // Imports the JSON encoding/decoding package
+	"errors"            // Imports helpers for inspecting error values
+	"io"                // Imports I/O utilities
+	"log"               // Imports logging utilities, silenced during download tests
+	"net"               // Imports network connection types for counting connections
+	"net/http"          // Imports HTTP client and server implementation
+	"net/http/httptest" // Imports a local HTTP server for download tests
+	"os"                // Imports OS interface for inspecting downloaded files
+	"path/filepath"     // Imports path helpers for the output directory
+	"reflect"           // Imports deep comparison of slices
+	"strings"           // Imports string readers for the test inputs
+	"sync/atomic"       // Imports an atomic counter for connections
+	"testing"           // Imports the Go testing framework
+)
+
+// Checks that appendPDFIDs extracts IDs from valid pages and reports malformed ones
+func TestAppendPDFIDs(t *testing.T) {
+	tests := []struct {
+		name    string   // Describes the case
+		input   string   // Page JSON fed to the parser
+		want    []string // IDs expected to be appended
+		wantErr error    // Error expected from errors.Is, or nil
+		wantSyn bool     // True if a JSON syntax error is expected
+	}{
+		{name: "valid page", input: `{"data":{"Page":1,"Data":[["A_PDF","EN"],["B","EN"],["C_PDF"]],"RowCount":3},"Exception":null}`, want: []string{"A_PDF", "C_PDF"}},
+		{name: "non-array rows are skipped", input: `{"data":{"Data":[1,[],{"k":"X_PDF"},["D_PDF"]]}}`, want: []string{"D_PDF"}},
+		{name: "truncated before Data array", input: `{"data":{"Data":`, wantErr: io.ErrUnexpectedEOF},
+		{name: "truncated at row boundary", input: `{"data":{"Data":[["A_PDF"],`, wantErr: io.ErrUnexpectedEOF},
+		{name: "truncated inside Data", input: `{"data":{"Data":[["A_PDF"],["B_PDF"]`, wantErr: io.ErrUnexpectedEOF},
+		{name: "truncated after Data", input: `{"data":{"Data":[["A_PDF"]]`, wantErr: io.ErrUnexpectedEOF},
+		{name: "truncated before data", input: `{"number":0,`, wantErr: io.ErrUnexpectedEOF},
+		{name: "empty input", input: ``, wantErr: io.ErrUnexpectedEOF},
+		{name: "trailing whitespace", input: "{\"data\":{\"Data\":[[\"A_PDF\"]]}}\n", want: []string{"A_PDF"}},
+		{name: "keys after Data", input: `{"data":{"Data":[["A_PDF"]],"RowCount":1,"X":{"a":[1]}},"Exception":null}`, want: []string{"A_PDF"}},
+		{name: "trailing second document", input: "{\"data\":{\"Data\":[[\"A_PDF\"]]}}\n{\"x\":1}", wantErr: errTrailingData},
+		{name: "trailing garbage", input: `{"data":{"Data":[["A_PDF"]]}}x`, wantSyn: true},
+		{name: "duplicate Data field", input: `{"data":{"Data":[["A_PDF"]],"Data":[["B_PDF"]]}}`, wantErr: errDuplicateKey},
+		{name: "duplicate data section", input: `{"data":{"Data":[["A_PDF"]]},"data":{}}`, wantErr: errDuplicateKey},
+		{name: "invalid syntax", input: `{"data":{"Data":[["A_PDF"] }}`, wantSyn: true},
+		{name: "missing data section", input: `{"number":0}`, wantErr: errMissingDataSection},
+		{name: "page is not an object", input: `[]`, wantErr: errMissingDataSection},
+		{name: "data is an array", input: `{"data":[]}`, wantErr: errMissingDataSection},
+		{name: "data is null", input: `{"data":null}`, wantErr: errMissingDataSection},
+		{name: "missing Data field", input: `{"data":{"Page":1}}`, wantErr: errMissingDataField},
+		{name: "Data is not an array", input: `{"data":{"Data":{}}}`, wantErr: errMissingDataField},
+	}
+
+	for _, test := range tests {
+		t.Run(test.name, func(t *testing.T) {
+			previous := []string{"EXISTING_PDF"} // IDs already collected from an earlier page
+
+			got, err := appendPDFIDs(previous, strings.NewReader(test.input))
+
+			if test.wantSyn {
+				var syntaxError *json.SyntaxError
+				if !errors.As(err, &syntaxError) {
+					t.Fatalf("error = %v, want a JSON syntax error", err)
+				}
+			} else if !errors.Is(err, test.wantErr) {
+				t.Fatalf("error = %v, want %v", err, test.wantErr)
+			}
+
+			want := append([]string{"EXISTING_PDF"}, test.want...) // Earlier IDs must survive, and a failed page adds nothing
+			if !reflect.DeepEqual(got, want) {
+				t.Fatalf("IDs = %v, want %v", got, want)
+			}
+		})
+	}
+}
+
+// Reader that hands out at most 16 KiB per Read, like a network response body
+type chunkedReader struct {
+	reader io.Reader // Underlying data
+}
+
+// Reads at most 16 KiB from the underlying reader
+func (c chunkedReader) Read(p []byte) (int, error) {
+	if len(p) > 16<<10 {
+		p = p[:16<<10] // Limits the read size
+	}
+	return c.reader.Read(p)
+}
+
+// Writer that counts its writes and, like *os.File, implements io.ReaderFrom with one write per read
+type countingFile struct {
+	bytes.Buffer     // Collects everything written
+	writes       int // Number of write calls that reached the "file"
+}
+
+// Records one write of p
+func (c *countingFile) Write(p []byte) (int, error) {
+	c.writes++ // Counts the write
+	return c.Buffer.Write(p)
+}
+
+// Copies from r with one write per read, the way an unbuffered file copy would behave
+func (c *countingFile) ReadFrom(r io.Reader) (int64, error) {
+	return io.Copy(struct{ io.Writer }{c}, r)
+}
+
+// Checks that copyBuffered turns many small reads into a few downloadBufferSize writes
+func TestCopyBuffered(t *testing.T) {
+	body := bytes.Repeat([]byte("x"), 3*downloadBufferSize+100) // Body a little over three buffers long
+	file := &countingFile{}                                     // Destination that records its writes
+
+	written, err := copyBuffered(file, chunkedReader{bytes.NewReader(body)})
+	if err != nil {
+		t.Fatalf("copyBuffered error = %v", err)
+	}
+	if written != int64(len(body)) || !bytes.Equal(file.Bytes(), body) {
+		t.Fatalf("copied %d bytes, want %d identical bytes", written, len(body))
+	}
+	if file.writes != 4 { // Three full buffers plus the final flush
+		t.Fatalf("writes = %d, want 4 (one per %d-byte buffer); the copy bypassed the buffer", file.writes, downloadBufferSize)
+	}
+}
+
+// Checks which responses downloadPDF saves, how it saves them, and that rejected responses keep their connection
+func TestDownloadPDF(t *testing.T) {
+	log.SetOutput(io.Discard)                      // Keeps the expected failure lines out of the test output
+	t.Cleanup(func() { log.SetOutput(os.Stderr) }) // Restores normal logging afterwards
+
+	pdfBody := "%PDF-1.4 " + strings.Repeat("x", 100<<10) // Body large enough to need several reads
+	server := httptest.NewUnstartedServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		switch r.URL.Query().Get("content") {
+		case "ok":
+			w.Header().Set("Content-Type", "application/pdf")
+			io.WriteString(w, pdfBody)
+		case "non-authoritative":
+			w.Header().Set("Content-Type", "application/pdf")
+			w.WriteHeader(http.StatusNonAuthoritativeInfo) // Any 2xx status is a success
+			io.WriteString(w, pdfBody)
+		case "empty":
+			w.Header().Set("Content-Type", "application/pdf") // No body at all
+		case "html":
+			w.Header().Set("Content-Type", "text/html")
+			io.WriteString(w, "<html>login page</html>")
+		default:
+			http.Error(w, "not found", http.StatusNotFound)
+		}
+	}))
+	var newConnections atomic.Int32 // Counts TCP connections opened by the client
+	server.Config.ConnState = func(_ net.Conn, state http.ConnState) {
+		if state == http.StateNew {
+			newConnections.Add(1)
+		}
+	}
+	server.Start()
+	defer server.Close()
+
+	outputPrefix := t.TempDir() + string(filepath.Separator) // Directory the PDFs are saved to
+	client := newHTTPClient(true)                            // Client configured the way main configures downloads
+
+	// Rejected responses come first, so reuse of their connection shows up in the connection count
+	for _, content := range []string{"missing", "html", "empty", "ok", "non-authoritative"} {
+		downloadPDF(client, server.URL+"/?content="+content, outputPrefix, content+".pdf")
+	}
+
+	entries, err := os.ReadDir(outputPrefix)
+	if err != nil {
+		t.Fatal(err)
+	}
+	var names []string // Files left in the output directory, in name order
+	for _, entry := range entries {
+		names = append(names, entry.Name())
+	}
+	if want := []string{"non-authoritative.pdf", "ok.pdf"}; !reflect.DeepEqual(names, want) {
+		t.Fatalf("output files = %v, want %v (no files for rejected responses, no leftover *.part files)", names, want)
+	}
+
+	for _, name := range names {
+		info, err := os.Stat(outputPrefix + name)
+		if err != nil {
+			t.Fatal(err)
+		}
+		if info.Mode().Perm() != 0644 {
+			t.Errorf("%s mode = %v, want 0644", name, info.Mode().Perm())
+		}
+		content, err := os.ReadFile(outputPrefix + name)
+		if err != nil {
+			t.Fatal(err)
+		}
+		if string(content) != pdfBody {
+			t.Errorf("%s has %d bytes, want the %d-byte response body", name, len(content), len(pdfBody))
+		}
+	}
+
+	if got := newConnections.Load(); got != 1 {
+		t.Errorf("client opened %d connections, want 1 (rejected responses should be drained so the connection is reused)", got)
+	}
+}